@@ -1,12 +1,204 @@
 """
 ✅ COMPLIANCE CHECKER PLUGIN - ERROR FREE VERSION
-Simple, working plugin with no dependencies
+Simple, working plugin - requires Python 3.10+ (slots dataclasses), no required dependencies
+
+Optional accelerators, used automatically when installed:
+  - orjson: faster report serialization (save_report, save_reports_bulk)
+  - numpy: vectorized batch checks (check_batch)
+  - google-re2 (re2): linear-time domain validation regex
 """
 
+import io
 import json
-from datetime import datetime
+import logging
+import numbers
+import os
+import tarfile
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field, asdict
+import re
+import time
 from pathlib import Path
 import sys
+from functools import lru_cache
+from typing import Optional
+
+# Optional: orjson serializes reports much faster than stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional: NumPy enables vectorized batch checks (check_batch)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Optional: Google RE2 guarantees a linear-time DFA match; stdlib re is fine otherwise
+try:
+    import re2 as _regex
+except ImportError:
+    _regex = re
+
+# One or more dot-separated labels (1-63 chars, alphanumeric, no leading/trailing hyphen).
+# Total length (max 253) is checked separately because RE2 has no lookahead support.
+_DOMAIN_PATTERN = (
+    r"(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+"
+    r"[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?"
+)
+_DOMAIN_RE = _regex.compile(_DOMAIN_PATTERN)
+
+@lru_cache(maxsize=4096)
+def _valid_domain(domain):
+    """Cached domain validation - audit runs see the same domains repeatedly"""
+    if not domain or len(domain) > 253:
+        return False
+    
+    # Single compiled match instead of a per-character Python loop
+    return _DOMAIN_RE.fullmatch(domain) is not None
+
+def _iso_now():
+    """Local time as an ISO-8601 string (seconds precision, no datetime object)"""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime())
+
+def _file_stamp(iso=None):
+    """Filename-safe timestamp (YYYYMMDD_HHMMSS), sliced from an existing ISO timestamp if given"""
+    if isinstance(iso, str) and len(iso) >= 19:
+        return f"{iso[0:4]}{iso[5:7]}{iso[8:10]}_{iso[11:13]}{iso[14:16]}{iso[17:19]}"
+    return time.strftime("%Y%m%d_%H%M%S", time.localtime())
+
+# Score deductions indexed by severity code (0=CRITICAL, 1=HIGH, 2=anything else)
+_SEVERITY_CODES = {"CRITICAL": 0, "HIGH": 1}
+_SEVERITY_PENALTY = (40, 20, 10)
+_WARNING_PENALTY = 5
+
+# Violation and warning rules - the single source of each rule's reference, severity
+# and wording, shared by check_certificate, check_batch and the batch scoring kernel.
+# description/action/suggestion are str.format templates filled by _violation/_warning.
+_VIOLATION_RULES = {
+    "R001": {"rule": "CAB Forum BR 7.1", "severity": "HIGH",
+             "description": "Validity {days} days exceeds maximum {limit} days",
+             "action": "Reduce validity period"},
+    "R002": {"rule": "NIST SP 800-57", "severity": "CRITICAL",
+             "description": "RSA key size {key_size} bits is below minimum {limit} bits",
+             "action": "Increase key size to at least {limit} bits"},
+    "R003": {"rule": "NIST SP 800-57", "severity": "CRITICAL",
+             "description": "ECC key size {key_size} bits is below minimum {limit} bits",
+             "action": "Increase key size to at least {limit} bits"},
+    "R004": {"rule": "RFC 5280", "severity": "HIGH",
+             "description": "Invalid domain format: {domain}",
+             "action": "Use valid domain name format"},
+}
+
+_WARNING_RULES = {
+    "W001": {"description": "Validity {days} days is longer than recommended {limit} days",
+             "suggestion": "Consider shorter validity for better security"},
+    "W002": {"description": "RSA-2048 is acceptable but consider migrating to RSA-3072 or ECC",
+             "suggestion": "Upgrade to RSA-3072+ for better security"},
+    "W003": {"description": "Wildcard certificate detected",
+             "suggestion": "Ensure proper access controls for wildcard certificates"},
+}
+
+# Column order of the batch violation mask, and the score penalty per column
+_BATCH_RULE_IDS = ("R001", "R002", "R003", "R004")
+_BATCH_RULE_PENALTY = tuple(
+    _SEVERITY_PENALTY[_SEVERITY_CODES.get(_VIOLATION_RULES[rule_id]["severity"], 2)]
+    for rule_id in _BATCH_RULE_IDS
+)
+if np is not None:
+    _BATCH_RULE_PENALTY = np.asarray(_BATCH_RULE_PENALTY, dtype=np.int32)
+
+def _violation(rule_id, **values):
+    """Build a violation dict for a rule in _VIOLATION_RULES"""
+    rule = _VIOLATION_RULES[rule_id]
+    return {
+        "id": rule_id,
+        "rule": rule["rule"],
+        "description": rule["description"].format(**values),
+        "severity": rule["severity"],
+        "action": rule["action"].format(**values)
+    }
+
+def _warning(rule_id, **values):
+    """Build a warning dict for a rule in _WARNING_RULES"""
+    rule = _WARNING_RULES[rule_id]
+    return {
+        "id": rule_id,
+        "description": rule["description"].format(**values),
+        "suggestion": rule["suggestion"].format(**values)
+    }
+
+# Key type codes used by the batch rule kernel
+_KEY_TYPE_CODES = {"RSA": 0, "ECC": 1}
+
+# Level-gated output: disabled messages are never formatted.
+# Handlers are left to the host application (the standalone test below sets one up).
+log = logging.getLogger("compliance")
+
+@dataclass(slots=True)
+class ComplianceResult:
+    """
+    Result of one certificate check
+    
+    Supports dict-style reads (result["score"], result.get(), "score" in result)
+    for plugin callers. It is not a dict: use to_dict() for json.dumps or to modify.
+    error is None unless the check itself failed; while unset it is treated as
+    absent, so the old "error" in result test still detects failed checks.
+    """
+    timestamp: str
+    domain: str
+    key_type: str
+    key_size: int
+    validity_days: int
+    violations_found: int
+    warnings_found: int
+    violations: list = field(default_factory=list)
+    warnings: list = field(default_factory=list)
+    compliant: bool = True
+    score: int = 100
+    error: Optional[str] = None
+    
+    def _has(self, key):
+        return key in self.__slots__ and (key != "error" or self.error is not None)
+    
+    def __getitem__(self, key):
+        if not self._has(key):
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key):
+        return self._has(key)
+    
+    def get(self, key, default=None):
+        if not self._has(key):
+            return default
+        return getattr(self, key)
+    
+    def to_dict(self):
+        """Plain dictionary copy of the result (no "error" key unless the check failed)"""
+        data = asdict(self)
+        if self.error is None:
+            del data["error"]
+        return data
+    
+    def _fields(self):
+        """Shallow field mapping for serialization (same keys as to_dict)"""
+        return {key: getattr(self, key) for key in self.__slots__ if self._has(key)}
+
+def _report_bytes(report):
+    """Serialize a report (dict or ComplianceResult) to indented UTF-8 JSON"""
+    if isinstance(report, ComplianceResult):
+        report = report._fields()
+    if orjson is not None:
+        return orjson.dumps(
+            report,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(report, indent=2, ensure_ascii=False, default=str).encode('utf-8')
 
 class ComplianceChecker:
     """Simple compliance checker that WORKS immediately"""
@@ -16,21 +208,33 @@ class ComplianceChecker:
         self.version = "1.0.0"
         self.enabled = True
         self.rules = self._load_rules()
-        print(f"✅ {self.name} v{self.version} initialized")
+        # Key-type specific rule checks, dispatched on the upper-cased key type
+        self._key_rules = {"RSA": self._check_rsa_key, "ECC": self._check_ecc_key}
+        log.info("✅ %s v%s initialized", self.name, self.version)
     
     def _load_rules(self):
         """Load compliance rules - NO EXTERNAL DEPENDENCIES"""
-        return {
+        rules = {
             "max_validity_days": 825,  # CAB Forum limit
             "min_key_size": {
                 "RSA": 2048,
                 "ECC": 256
             },
             "allowed_ecc_curves": ["P-256", "P-384", "P-521"],
-            "disallowed_algorithms": ["MD5", "SHA1", "RC4"]
+            "disallowed_algorithms": frozenset(("MD5", "SHA1", "RC4"))  # O(1) membership
         }
+        
+        # Cache hot-path thresholds as plain attributes (no dict lookups per check)
+        self._max_days = rules["max_validity_days"]
+        self._warn_days = 398  # Recommended maximum (~13 months)
+        self._min_rsa = rules["min_key_size"]["RSA"]
+        self._min_ecc = rules["min_key_size"]["ECC"]
+        self._disallowed_set = rules["disallowed_algorithms"]
+        
+        return rules
     
-    def check_certificate(self, domain="example.com", days=365, key_type="RSA", key_size=2048):
+    def check_certificate(self, domain="example.com", days=365, key_type="RSA", key_size=2048,
+                          verbose=False):
         """
         Check certificate compliance - SIMPLE VERSION
         
@@ -39,164 +243,288 @@ class ComplianceChecker:
             days: Validity in days (int)
             key_type: RSA or ECC (string)
             key_size: Key size in bits (int)
+            verbose: Log the full check details at INFO level (bool)
         
-        Returns: Dictionary with results
+        Returns: ComplianceResult (with error set if the check failed)
         """
-        print(f"\n🔍 Compliance Check for: {domain}")
-        print(f"   - Validity: {days} days")
-        print(f"   - Key: {key_type}-{key_size}")
+        if verbose:
+            log.info("\n🔍 Compliance Check for: %s", domain)
+            log.info("   - Validity: %s days", days)
+            log.info("   - Key: %s-%s", key_type, key_size)
         
         violations = []
         warnings = []
         
         try:
-            # Rule 1: Check validity period
-            if days > self.rules["max_validity_days"]:
-                violations.append({
-                    "id": "R001",
-                    "rule": "CAB Forum BR 7.1",
-                    "description": f"Validity {days} days exceeds maximum {self.rules['max_validity_days']} days",
-                    "severity": "HIGH",
-                    "action": "Reduce validity period"
-                })
-            elif days > 398:  # Additional warning for >13 months
-                warnings.append({
-                    "id": "W001",
-                    "description": f"Validity {days} days is longer than recommended 398 days",
-                    "suggestion": "Consider shorter validity for better security"
-                })
+            kt = key_type.upper()  # Normalize once for all key rules
             
-            # Rule 2: Check RSA key size
-            if key_type.upper() == "RSA":
-                min_size = self.rules["min_key_size"]["RSA"]
-                if key_size < min_size:
-                    violations.append({
-                        "id": "R002",
-                        "rule": "NIST SP 800-57",
-                        "description": f"RSA key size {key_size} bits is below minimum {min_size} bits",
-                        "severity": "CRITICAL",
-                        "action": f"Increase key size to at least {min_size} bits"
-                    })
-                elif key_size == 2048:
-                    warnings.append({
-                        "id": "W002",
-                        "description": "RSA-2048 is acceptable but consider migrating to RSA-3072 or ECC",
-                        "suggestion": "Upgrade to RSA-3072+ for better security"
-                    })
+            # Rule 1: Check validity period
+            if days > self._max_days:
+                violations.append(_violation("R001", days=days, limit=self._max_days))
+            elif days > self._warn_days:  # Additional warning for >13 months
+                warnings.append(_warning("W001", days=days, limit=self._warn_days))
             
-            # Rule 3: Check ECC curves
-            if key_type.upper() == "ECC":
-                min_size = self.rules["min_key_size"]["ECC"]
-                if key_size < min_size:
-                    violations.append({
-                        "id": "R003",
-                        "rule": "NIST SP 800-57",
-                        "description": f"ECC key size {key_size} bits is below minimum {min_size} bits",
-                        "severity": "CRITICAL",
-                        "action": f"Increase key size to at least {min_size} bits"
-                    })
+            # Rules 2-3: Key size rules specialized per key type (only one runs)
+            key_rule = self._key_rules.get(kt)
+            if key_rule is not None:
+                key_rule(key_size, violations, warnings)
             
             # Rule 4: Check domain name
             if not self._is_valid_domain(domain):
-                violations.append({
-                    "id": "R004",
-                    "rule": "RFC 5280",
-                    "description": f"Invalid domain format: {domain}",
-                    "severity": "HIGH",
-                    "action": "Use valid domain name format"
-                })
+                violations.append(_violation("R004", domain=domain))
             
             # Rule 5: Check for wildcard certificates
             if domain.startswith("*."):
-                warnings.append({
-                    "id": "W003",
-                    "description": "Wildcard certificate detected",
-                    "suggestion": "Ensure proper access controls for wildcard certificates"
-                })
+                warnings.append(_warning("W003"))
             
             # Prepare results
-            result = {
-                "timestamp": datetime.now().isoformat(),
-                "domain": domain,
-                "key_type": key_type,
-                "key_size": key_size,
-                "validity_days": days,
-                "violations_found": len(violations),
-                "warnings_found": len(warnings),
-                "violations": violations,
-                "warnings": warnings,
-                "compliant": len(violations) == 0,
-                "score": self._calculate_score(violations, warnings)
-            }
+            result = ComplianceResult(
+                timestamp=_iso_now(),
+                domain=domain,
+                key_type=key_type,
+                key_size=key_size,
+                validity_days=days,
+                violations_found=len(violations),
+                warnings_found=len(warnings),
+                violations=violations,
+                warnings=warnings,
+                compliant=len(violations) == 0,
+                score=self._calculate_score(violations, warnings)
+            )
             
-            # Print summary
-            print(f"\n📊 COMPLIANCE RESULTS:")
-            print(f"   - Status: {'✅ COMPLIANT' if result['compliant'] else '❌ NON-COMPLIANT'}")
-            print(f"   - Violations: {result['violations_found']}")
-            print(f"   - Warnings: {result['warnings_found']}")
-            print(f"   - Score: {result['score']}/100")
-            
-            if violations:
-                print(f"\n🚫 VIOLATIONS:")
-                for v in violations:
-                    print(f"   • [{v['severity']}] {v['description']}")
-                    print(f"     Action: {v['action']}")
-            
-            if warnings:
-                print(f"\n⚠️  WARNINGS:")
-                for w in warnings:
-                    print(f"   • {w['description']}")
-                    print(f"     Suggestion: {w['suggestion']}")
+            # Log summary (skipped entirely when not verbose)
+            if verbose and log.isEnabledFor(logging.INFO):
+                log.info("\n📊 COMPLIANCE RESULTS:")
+                log.info("   - Status: %s", '✅ COMPLIANT' if result.compliant else '❌ NON-COMPLIANT')
+                log.info("   - Violations: %s", result.violations_found)
+                log.info("   - Warnings: %s", result.warnings_found)
+                log.info("   - Score: %s/100", result.score)
+                
+                if violations:
+                    log.info("\n🚫 VIOLATIONS:")
+                    for v in violations:
+                        log.info("   • [%s] %s", v['severity'], v['description'])
+                        log.info("     Action: %s", v['action'])
+                
+                if warnings:
+                    log.info("\n⚠️  WARNINGS:")
+                    for w in warnings:
+                        log.info("   • %s", w['description'])
+                        log.info("     Suggestion: %s", w['suggestion'])
             
             return result
             
         except Exception as e:
             # Safe error handling
-            error_result = {
-                "timestamp": datetime.now().isoformat(),
-                "domain": domain,
-                "error": str(e),
-                "compliant": False,
-                "score": 0
-            }
-            print(f"❌ Error during compliance check: {e}")
+            error_result = ComplianceResult(
+                timestamp=_iso_now(),
+                domain=domain,
+                key_type=key_type,
+                key_size=key_size,
+                validity_days=days,
+                violations_found=0,
+                warnings_found=0,
+                compliant=False,
+                score=0,
+                error=str(e)
+            )
+            log.error("❌ Error during compliance check: %s", e)
             return error_result
     
-    def _is_valid_domain(self, domain):
-        """Simple domain validation"""
-        if not domain or len(domain) > 253:
-            return False
+    def _check_rsa_key(self, key_size, violations, warnings):
+        """Rule 2: Check RSA key size"""
+        min_size = self._min_rsa
+        if key_size < min_size:
+            violations.append(_violation("R002", key_size=key_size, limit=min_size))
+        elif key_size == 2048:
+            warnings.append(_warning("W002"))
+    
+    def _check_ecc_key(self, key_size, violations, warnings):
+        """Rule 3: Check ECC key size"""
+        min_size = self._min_ecc
+        if key_size < min_size:
+            violations.append(_violation("R003", key_size=key_size, limit=min_size))
+    
+    def check_batch(self, domains, days, key_types, key_sizes):
+        """
+        Check many certificates at once using NumPy array comparisons
+        
+        Args:
+            domains: Domain names (sequence or array of strings)
+            days: Validity in days (sequence or array of ints)
+            key_types: RSA or ECC (sequence or array of strings)
+            key_sizes: Key sizes in bits (sequence or array of ints)
+        
+        Returns: List of ComplianceResult (same shape as check_certificate)
+        
+        Raises: ValueError if the inputs differ in length or days/key_sizes
+                are not integers
+        """
+        n = len(domains)
+        if not (len(days) == len(key_types) == len(key_sizes) == n):
+            raise ValueError(
+                f"check_batch inputs must have the same length (domains={n}, days={len(days)}, "
+                f"key_types={len(key_types)}, key_sizes={len(key_sizes)})"
+            )
+        if n == 0:
+            return []
+        
+        if np is None:
+            for name, values in (("days", days), ("key_sizes", key_sizes)):
+                for v in values:
+                    if isinstance(v, bool) or not isinstance(v, numbers.Integral):
+                        raise ValueError(f"check_batch {name} must be integers, got {v!r}")
+            # No NumPy - fall back to one check per certificate, sharing one timestamp
+            timestamp = _iso_now()
+            results = [
+                self.check_certificate(domain=d, days=dy, key_type=kt, key_size=ks)
+                for d, dy, kt, ks in zip(domains, days, key_types, key_sizes)
+            ]
+            for result in results:
+                result.timestamp = timestamp
+            return results
+        
+        days = np.asarray(days)
+        key_sizes = np.asarray(key_sizes)
+        for name, values in (("days", days), ("key_sizes", key_sizes)):
+            if values.ndim != 1 or values.dtype.kind not in "iu":
+                raise ValueError(f"check_batch {name} must be a sequence of integers (got {values.dtype})")
+        
+        # Rows check_certificate would reject (non-string domain or key type) get
+        # the same error result from it; everything else goes through the kernel
+        domains = list(domains)
+        key_types = list(key_types)
+        bad_rows = [i for i in range(n)
+                    if not (isinstance(domains[i], str) and isinstance(key_types[i], str))]
+        results = [None] * n
+        for i in bad_rows:
+            results[i] = self.check_certificate(
+                domain=domains[i], days=int(days[i]), key_type=key_types[i], key_size=int(key_sizes[i])
+            )
+        
+        rows = np.arange(n)
+        if bad_rows:
+            rows = np.delete(rows, bad_rows)
+            if rows.size == 0:
+                return results
+        
+        domains = np.asarray([domains[i] for i in rows], dtype=str)
+        key_types = np.asarray([key_types[i] for i in rows], dtype=str)
+        days = days[rows]
+        key_sizes = key_sizes[rows]
+        n = rows.size
         
-        # Basic check for dots
-        parts = domain.split('.')
-        if len(parts) < 2:
-            return False
+        # Key types become int8 codes once (-1 = neither RSA nor ECC)
+        key_type_codes = np.fromiter(
+            (_KEY_TYPE_CODES.get(k.upper(), -1) for k in key_types.tolist()),
+            dtype=np.int8, count=n
+        )
         
-        # Check each part
-        for part in parts:
-            if not part or len(part) > 63:
-                return False
-            # Simple alphanumeric check
-            if not all(c.isalnum() or c == '-' for c in part):
-                return False
+        # Domain check: length filter on the whole array, regex only on survivors
+        lengths = np.char.str_len(domains)
+        domain_valid = (lengths > 0) & (lengths <= 253)
+        for i in np.flatnonzero(domain_valid):
+            domain_valid[i] = _valid_domain(str(domains[i]))
+        wildcard = np.char.startswith(domains, "*.")
         
-        return True
+        viol_mask, warn_mask, scores = self._check_many(
+            days, key_type_codes, key_sizes, domain_valid, wildcard
+        )
+        viol_days, viol_rsa, viol_ecc, viol_domain = viol_mask.T
+        warn_days, warn_rsa, wildcard = warn_mask.T
+        
+        violations = [[] for _ in range(n)]
+        warnings = [[] for _ in range(n)]
+        
+        # Materialize dicts only for flagged rows, in the same order as check_certificate
+        for i in np.flatnonzero(viol_days):
+            violations[i].append(_violation("R001", days=days[i], limit=self._max_days))
+        for i in np.flatnonzero(warn_days):
+            warnings[i].append(_warning("W001", days=days[i], limit=self._warn_days))
+        for i in np.flatnonzero(viol_rsa):
+            violations[i].append(_violation("R002", key_size=key_sizes[i], limit=self._min_rsa))
+        
+        w002 = _warning("W002")
+        for i in np.flatnonzero(warn_rsa):
+            warnings[i].append(w002.copy())
+        
+        for i in np.flatnonzero(viol_ecc):
+            violations[i].append(_violation("R003", key_size=key_sizes[i], limit=self._min_ecc))
+        for i in np.flatnonzero(viol_domain):
+            violations[i].append(_violation("R004", domain=domains[i]))
+        
+        w003 = _warning("W003")
+        for i in np.flatnonzero(wildcard):
+            warnings[i].append(w003.copy())
+        
+        # Prepare results - one timestamp for the whole batch
+        timestamp = _iso_now()
+        for i, row in enumerate(rows.tolist()):
+            results[row] = ComplianceResult(
+                timestamp=timestamp,
+                domain=str(domains[i]),
+                key_type=str(key_types[i]),
+                key_size=int(key_sizes[i]),
+                validity_days=int(days[i]),
+                violations_found=len(violations[i]),
+                warnings_found=len(warnings[i]),
+                violations=violations[i],
+                warnings=warnings[i],
+                compliant=len(violations[i]) == 0,
+                score=int(scores[i])
+            )
+        
+        compliant = sum(r.compliant for r in results)
+        log.info("📦 Batch compliance check: %s/%s compliant", compliant, len(results))
+        return results
+    
+    def _check_many(self, days, key_type_codes, key_sizes, domain_valid, wildcard):
+        """
+        Rule kernel for check_batch - integer compares only, no Python objects
+        
+        Args:
+            days: Validity in days (int array)
+            key_type_codes: Key type codes from _KEY_TYPE_CODES (int8 array)
+            key_sizes: Key sizes in bits (int array)
+            domain_valid: Domain passed validation (bool array)
+            wildcard: Domain is a wildcard (bool array)
+        
+        Returns: (violations mask (N, 4) uint8, columns in _BATCH_RULE_IDS order,
+                  warnings mask (N, 3) uint8 for W001-W003,
+                  scores (N,) int32)
+        """
+        is_rsa = key_type_codes == _KEY_TYPE_CODES["RSA"]
+        is_ecc = key_type_codes == _KEY_TYPE_CODES["ECC"]
+        
+        viol_days = days > self._max_days
+        viol_rsa = is_rsa & (key_sizes < self._min_rsa)
+        viol_ecc = is_ecc & (key_sizes < self._min_ecc)
+        viol_mask = np.column_stack((viol_days, viol_rsa, viol_ecc, ~domain_valid)).astype(np.uint8)
+        
+        warn_days = ~viol_days & (days > self._warn_days)
+        warn_rsa = is_rsa & ~viol_rsa & (key_sizes == 2048)
+        warn_mask = np.column_stack((warn_days, warn_rsa, wildcard)).astype(np.uint8)
+        
+        # Scores: violation mask times per-rule penalty, minus warnings
+        warn_count = warn_mask.sum(axis=1, dtype=np.int32)
+        scores = np.maximum(100 - viol_mask @ _BATCH_RULE_PENALTY - warn_count * _WARNING_PENALTY, 0)
+        
+        return viol_mask, warn_mask, scores.astype(np.int32)
+    
+    def _is_valid_domain(self, domain):
+        """Simple domain validation"""
+        return _valid_domain(domain)
     
     def _calculate_score(self, violations, warnings):
         """Calculate compliance score (0-100)"""
         base_score = 100
         
-        # Deduct for violations
+        # Deduct for violations (one table lookup per violation)
         for v in violations:
-            if v["severity"] == "CRITICAL":
-                base_score -= 40
-            elif v["severity"] == "HIGH":
-                base_score -= 20
-            else:
-                base_score -= 10
+            base_score -= _SEVERITY_PENALTY[_SEVERITY_CODES.get(v["severity"], 2)]
         
         # Deduct for warnings
-        base_score -= len(warnings) * 5
+        base_score -= len(warnings) * _WARNING_PENALTY
         
         return max(0, base_score)  # Don't go below 0
     
@@ -209,37 +537,109 @@ class ComplianceChecker:
             
             # Generate filename if not provided
             if not filename:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 safe_domain = report.get('domain', 'unknown').replace('.', '_')
-                filename = f"compliance_{safe_domain}_{timestamp}.json"
+                # Reuse the check's own timestamp instead of formatting the clock again
+                filename = f"compliance_{safe_domain}_{_file_stamp(report.get('timestamp'))}.json"
             
             # Save file
             filepath = reports_dir / filename
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(_report_bytes(report))
             
-            print(f"📄 Report saved: {filepath}")
+            log.info("📄 Report saved: %s", filepath)
             return str(filepath)
             
         except Exception as e:
-            print(f"⚠️  Could not save report: {e}")
+            log.warning("⚠️  Could not save report: %s", e)
             # Still return success but log the error
             return None
     
+    def save_reports_bulk(self, reports, filename=None):
+        """Save many reports into one .tar.gz archive instead of one file each"""
+        tmp_name = None
+        try:
+            # Create reports directory if it doesn't exist
+            reports_dir = Path("plugins/reports")
+            reports_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Generate a filename that doesn't clobber an earlier archive
+            timestamp = _file_stamp()
+            if not filename:
+                filename = f"compliance_reports_{timestamp}.tar.gz"
+                suffix = 1
+                while (reports_dir / filename).exists():
+                    suffix += 1
+                    filename = f"compliance_reports_{timestamp}_{suffix}.tar.gz"
+            filepath = reports_dir / filename
+            
+            # Stream every report into a temp archive; only replace the target on success
+            fd, tmp_name = tempfile.mkstemp(dir=reports_dir, suffix=".tmp")
+            mtime = time.time()
+            count = 0
+            with os.fdopen(fd, 'wb') as raw, tarfile.open(fileobj=raw, mode='w:gz') as tar:
+                for report in reports:
+                    try:
+                        data = _report_bytes(report)
+                    except (TypeError, ValueError) as e:
+                        log.warning("⚠️  Skipping unserializable report: %s", e)
+                        continue
+                    count += 1
+                    safe_domain = str(report.get('domain') or 'unknown').replace('.', '_')
+                    info = tarfile.TarInfo(name=f"compliance_{safe_domain}_{timestamp}_{count}.json")
+                    info.size = len(data)
+                    info.mtime = mtime
+                    tar.addfile(info, io.BytesIO(data))
+            os.replace(tmp_name, filepath)
+            tmp_name = None
+            
+            log.info("📦 %s reports saved: %s", count, filepath)
+            return str(filepath)
+            
+        except Exception as e:
+            log.warning("⚠️  Could not save reports: %s", e)
+            return None
+        
+        finally:
+            # Remove a partial archive left by a failed save
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+    
     def run(self, *args, **kwargs):
-        """Alias for check_certificate - for plugin compatibility"""
+        """Alias for check_certificate - for plugin compatibility (returns ComplianceResult)"""
         return self.check_certificate(*args, **kwargs)
     
     def execute(self, *args, **kwargs):
-        """Another alias for check_certificate"""
+        """Another alias for check_certificate (returns ComplianceResult)"""
         return self.check_certificate(*args, **kwargs)
 
 
 # ============================================================================
 # TEST FUNCTION - Run this directly in VS Code
 # ============================================================================
-def test_compliance_checker():
-    """Test the compliance checker - NO ERRORS GUARANTEED"""
+# Below this many cases, process start-up costs more than the checks themselves
+_POOL_MIN_CASES = 256
+
+_worker_checker = None
+
+def _check_one(case):
+    """Run one check in a worker process (one checker per process)"""
+    global _worker_checker
+    if _worker_checker is None:
+        _worker_checker = ComplianceChecker()
+    return _worker_checker.check_certificate(**case)
+
+def test_compliance_checker(test_cases=None, parallel=None):
+    """
+    Test the compliance checker - NO ERRORS GUARANTEED
+    
+    Args:
+        test_cases: List of check_certificate kwargs (default: built-in cases)
+        parallel: Run checks on a process pool - True, False, or None to decide
+                  by batch size (_POOL_MIN_CASES)
+    """
     print("🧪 TESTING COMPLIANCE CHECKER")
     print("=" * 50)
     
@@ -247,37 +647,53 @@ def test_compliance_checker():
     checker = ComplianceChecker()
     
     # Test cases
-    test_cases = [
-        {"domain": "example.com", "days": 365, "key_type": "RSA", "key_size": 2048},
-        {"domain": "test.example.com", "days": 900, "key_type": "RSA", "key_size": 1024},  # Should fail
-        {"domain": "api.company.com", "days": 30, "key_type": "ECC", "key_size": 256},
-        {"domain": "*.wildcard.com", "days": 365, "key_type": "RSA", "key_size": 2048},
-        {"domain": "invalid", "days": 365, "key_type": "RSA", "key_size": 2048},  # Should fail
-    ]
-    
-    for i, test in enumerate(test_cases, 1):
+    if test_cases is None:
+        test_cases = [
+            {"domain": "example.com", "days": 365, "key_type": "RSA", "key_size": 2048},
+            {"domain": "test.example.com", "days": 900, "key_type": "RSA", "key_size": 1024},  # Should fail
+            {"domain": "api.company.com", "days": 30, "key_type": "ECC", "key_size": 256},
+            {"domain": "*.wildcard.com", "days": 365, "key_type": "RSA", "key_size": 2048},
+            {"domain": "invalid", "days": 365, "key_type": "RSA", "key_size": 2048},  # Should fail
+        ]
+    
+    # Run compliance checks - by default in parallel only for batches big enough to pay off
+    if parallel is None:
+        parallel = len(test_cases) >= _POOL_MIN_CASES
+    results = None
+    if parallel and test_cases:
+        try:
+            workers = min(len(test_cases), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_check_one, test_cases))
+        except (OSError, BrokenProcessPool) as e:
+            print(f"⚠️  Process pool unavailable ({e}), running sequentially")
+    if results is None:
+        results = [checker.check_certificate(**test) for test in test_cases]
+    
+    for i, (test, result) in enumerate(zip(test_cases, results), 1):
         print(f"\n{'='*60}")
         print(f"TEST CASE {i}: {test['domain']}")
         print('='*60)
         
-        # Run compliance check
-        result = checker.check_certificate(**test)
-        
-        # Save report
-        if result and 'error' not in result:
-            checker.save_report(result)
-        
         # Print pass/fail
         if result.get('compliant', False):
             print(f"\n🎉 RESULT: PASS")
         else:
             print(f"\n❌ RESULT: FAIL")
+            if result.get('error'):
+                print(f"   • Error: {result['error']}")
+            for v in result.get('violations') or []:
+                print(f"   • [{v['severity']}] {v['description']}")
+                print(f"     Action: {v['action']}")
         
         print(f"Score: {result.get('score', 0)}/100")
     
+    # Save all reports in one archive
+    archive = checker.save_reports_bulk(r for r in results if 'error' not in r)
+    
     print("\n" + "="*50)
     print("✅ ALL TESTS COMPLETED SUCCESSFULLY!")
-    print("Reports saved to: plugins/reports/")
+    print(f"Reports saved to: {archive or 'plugins/reports/'}")
     print("="*50)
 
 
@@ -285,6 +701,9 @@ def test_compliance_checker():
 # STANDALONE TEST - Run this file directly
 # ============================================================================
 if __name__ == "__main__":
+    # Show checker log output on the console like the rest of the demo
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    
     print("\n🔐 CLAUDE CRYPTO AGENT - COMPLIANCE CHECKER")
     print("Version: 1.0.0 (Error-Free)")
     print("="*50)
@@ -304,7 +723,7 @@ if __name__ == "__main__":
             days = int(days) if days.isdigit() else 365
             
             checker = ComplianceChecker()
-            result = checker.check_certificate(domain=domain, days=days)
+            result = checker.check_certificate(domain=domain, days=days, verbose=True)
             checker.save_report(result)
             
             print(f"\n✅ Check completed for {domain}")